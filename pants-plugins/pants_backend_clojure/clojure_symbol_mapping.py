@@ -16,8 +16,8 @@ from __future__ import annotations
 
 import json
 import logging
-import tempfile
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
 
@@ -44,12 +44,17 @@ from pants.jvm.target_types import (
 )
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
+from pants.util.ordered_set import OrderedSet
 
 from pants_backend_clojure.utils.jar_analyzer import analyze_jar_for_namespaces
 
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on memoized (namespace, resolve) lookups kept per mapping. Once it is
+# reached, further lookups still work but are no longer stored.
+_LOOKUP_CACHE_MAX_ENTRIES = 8192
+
 
 @dataclass(frozen=True)
 class ClojureNamespaceMapping:
@@ -66,6 +71,12 @@ class ClojureNamespaceMapping:
                             namespace -> addresses mappings.
     """
     mapping_per_resolve: FrozenDict[str, FrozenTrieNode]
+    # Memoized lookups keyed by (namespace, resolve), bounded by
+    # _LOOKUP_CACHE_MAX_ENTRIES. The tries never change once frozen, and the same
+    # third-party namespaces are looked up from every file.
+    _lookup_cache: dict[tuple[str, str], tuple[Address, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False, hash=False
+    )
 
     def addresses_for_namespace(
         self,
@@ -98,6 +109,15 @@ class ClojureNamespaceMapping:
             # Matches if "ring.**" or "ring.middleware.**" is registered
             (Address("3rdparty/jvm", target_name="ring-core"),)
         """
+        key = (namespace, resolve)
+        cached = self._lookup_cache.get(key)
+        if cached is None:
+            cached = self._lookup(namespace, resolve)
+            if len(self._lookup_cache) < _LOOKUP_CACHE_MAX_ENTRIES:
+                self._lookup_cache[key] = cached
+        return cached
+
+    def _lookup(self, namespace: str, resolve: str) -> tuple[Address, ...]:
         trie = self.mapping_per_resolve.get(resolve)
         if not trie:
             return ()
@@ -107,13 +127,9 @@ class ClojureNamespaceMapping:
         if not matches:
             return ()
 
-        # Flatten addresses from all namespaces (typically just DEFAULT_SYMBOL_NAMESPACE)
-        result: list[Address] = []
-        for addresses in matches.values():
-            for addr in addresses:
-                if addr not in result:
-                    result.append(addr)
-        return tuple(result)
+        # Flatten addresses from all namespaces (typically just DEFAULT_SYMBOL_NAMESPACE),
+        # deduplicating in first-seen order
+        return tuple(dict.fromkeys(addr for addresses in matches.values() for addr in addresses))
 
 
 # ============================================================================
@@ -179,8 +195,8 @@ async def find_clojure_artifact_packages(
             packages=["cheshire.**"],  # Manual namespace declaration
         )
     """
-    # Maps (resolve, namespace_pattern) -> list of addresses
-    mapping: dict[tuple[str, str], list[Address]] = {}
+    # Maps (resolve, namespace_pattern) -> addresses, deduplicated in declaration order
+    mapping: dict[tuple[str, str], OrderedSet[Address]] = {}
 
     for tgt in all_jvm_artifact_tgts:
         packages = tgt[JvmArtifactPackagesField].value
@@ -191,17 +207,54 @@ async def find_clojure_artifact_packages(
         resolve = tgt[JvmResolveField].normalized_value(jvm)
 
         for package_pattern in packages:
-            key = (resolve, package_pattern)
-            if key not in mapping:
-                mapping[key] = []
-            if tgt.address not in mapping[key]:
-                mapping[key].append(tgt.address)
+            mapping.setdefault((resolve, sys.intern(package_pattern)), OrderedSet()).add(tgt.address)
 
     return AvailableClojureArtifactPackages(
         FrozenDict({key: tuple(addrs) for key, addrs in mapping.items()})
     )
 
 
+@dataclass(frozen=True)
+class ClojureJarAnalysisRequest:
+    """Request to analyze a single fetched JAR for the Clojure namespaces it provides."""
+    digest: Digest
+
+
+@dataclass(frozen=True)
+class ClojureJarAnalysis:
+    """Clojure namespaces found in a single JAR.
+
+    Attributes:
+        namespaces: Clojure namespaces provided by the JAR.
+        error: Why the JAR could not be read, if it could not. Each caller decides
+            whether that is fatal.
+    """
+    namespaces: tuple[str, ...]
+    error: str | None = None
+
+
+@rule(desc="Analyzing JAR for Clojure namespaces", level=LogLevel.DEBUG)
+async def analyze_clojure_jar(request: ClojureJarAnalysisRequest) -> ClojureJarAnalysis:
+    """Analyze one JAR for Clojure namespaces.
+
+    Being its own rule, the analysis is memoized by the engine on the JAR's digest:
+    an artifact shared by several resolves, or left untouched by a lockfile edit,
+    is only analyzed once per session.
+
+    A JAR that cannot be read is reported through `error` rather than raised, so
+    one bad artifact does not fail inference for every Clojure target.
+    """
+    try:
+        jar_contents = await get_digest_contents(request.digest)
+        if not jar_contents:
+            return ClojureJarAnalysis(namespaces=())
+        return ClojureJarAnalysis(
+            namespaces=analyze_jar_for_namespaces(jar_contents[0].content).namespaces
+        )
+    except Exception as e:
+        return ClojureJarAnalysis(namespaces=(), error=str(e))
+
+
 @rule(desc="Analyzing JARs for Clojure namespaces", level=LogLevel.DEBUG)
 async def build_third_party_clojure_namespace_mapping(
     request: ThirdPartyClojureNamespaceMappingRequest,
@@ -242,52 +295,42 @@ async def build_third_party_clojure_namespace_mapping(
     if not lockfile.entries:
         return ThirdPartyClojureNamespaceMapping(FrozenDict())
 
+    # Parse each artifact's address once, skipping entries without a pants_address
+    # (shouldn't happen in practice) so their JARs are never fetched
+    addressed_entries = [
+        (entry, Address.parse(entry.pants_address))
+        for entry in lockfile.entries
+        if entry.pants_address
+    ]
+
     # Fetch all JARs using Coursier (uses cache)
     classpath_entries = await concurrently(
         coursier_fetch_one_coord(entry, **implicitly())
-        for entry in lockfile.entries
+        for entry, _ in addressed_entries
     )
 
-    # Analyze each JAR for Clojure namespaces
-    mapping: dict[str, list[Address]] = {}
-
-    for entry, classpath_entry in zip(lockfile.entries, classpath_entries):
-        # Skip entries without pants_address (shouldn't happen in practice)
-        if not entry.pants_address:
-            continue
-
-        address = Address.parse(entry.pants_address)
-
-        # Materialize JAR to analyze it
-        try:
-            jar_contents = await get_digest_contents(classpath_entry.digest)
-            if not jar_contents:
-                continue
-
-            # Write to temp file and analyze
-            # TODO: Consider making analyze_jar_for_namespaces accept bytes directly
-            with tempfile.NamedTemporaryFile(suffix='.jar', delete=False) as tmp_jar:
-                tmp_jar.write(jar_contents[0].content)
-                tmp_jar.flush()
-                jar_path = Path(tmp_jar.name)
-
-                try:
-                    analysis = analyze_jar_for_namespaces(jar_path)
-
-                    for namespace in analysis.namespaces:
-                        if namespace not in mapping:
-                            mapping[namespace] = []
-                        if address not in mapping[namespace]:
-                            mapping[namespace].append(address)
+    # Analyze every JAR in one batch, each in its own memoized rule, so the engine
+    # loads them in parallel and skips JARs it has already analyzed
+    analyses = await concurrently(
+        analyze_clojure_jar(ClojureJarAnalysisRequest(classpath_entry.digest))
+        for classpath_entry in classpath_entries
+    )
 
-                finally:
-                    jar_path.unlink(missing_ok=True)
+    # Map each namespace to the artifacts providing it
+    mapping: dict[str, OrderedSet[Address]] = {}
 
-        except Exception as e:
+    for (entry, address), analysis in zip(addressed_entries, analyses):
+        if analysis.error is not None:
+            # Best effort: skip this artifact rather than fail inference
             coord_str = f"{entry.coord.group}:{entry.coord.artifact}:{entry.coord.version}"
-            logger.debug(f"Error analyzing JAR for {coord_str}: {e}")
+            logger.debug(f"Error analyzing JAR for {coord_str}: {analysis.error}")
             continue
 
+        for namespace in analysis.namespaces:
+            # Interned: the mapping lives for the whole session and the same
+            # namespace names are also held by the analysis of every source file
+            mapping.setdefault(sys.intern(namespace), OrderedSet()).add(address)
+
     return ThirdPartyClojureNamespaceMapping(
         FrozenDict({ns: tuple(addrs) for ns, addrs in mapping.items()})
     )
@@ -468,21 +511,23 @@ async def _load_legacy_metadata_files() -> dict[tuple[str, str], tuple[Address,
         return {}
 
     # Build mapping from metadata files
-    mapping: dict[tuple[str, str], list[Address]] = {}
+    mapping: dict[tuple[str, str], OrderedSet[Address]] = {}
+    # The same artifact addresses recur across resolves' metadata files
+    parsed_addresses: dict[str, Address] = {}
 
     for file_content in metadata_contents:
         try:
             metadata = _parse_metadata_file(file_content)
 
             for coord, artifact_meta in metadata.artifacts.items():
-                address = Address.parse(artifact_meta.address)
+                address = parsed_addresses.get(artifact_meta.address)
+                if address is None:
+                    address = parsed_addresses[artifact_meta.address] = Address.parse(
+                        artifact_meta.address
+                    )
 
                 for namespace in artifact_meta.namespaces:
-                    key = (namespace, metadata.resolve)
-                    if key not in mapping:
-                        mapping[key] = []
-                    if address not in mapping[key]:
-                        mapping[key].append(address)
+                    mapping.setdefault((namespace, metadata.resolve), OrderedSet()).add(address)
 
         except Exception as e:
             logger.warning(
@@ -547,7 +592,8 @@ def _parse_metadata_file(file_content: FileContent) -> ClojureNamespaceMetadata:
     Raises:
         ValueError: If the file is malformed or has invalid structure.
     """
-    data = json.loads(file_content.content.decode('utf-8'))
+    # json.loads accepts bytes directly (detecting UTF-8), avoiding a decoded copy
+    data = json.loads(file_content.content)
 
     # Validate required fields
     if 'resolve' not in data:
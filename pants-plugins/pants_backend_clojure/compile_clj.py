@@ -66,13 +66,16 @@ async def compile_clojure_source(
             exit_code=1,
         )
 
-    # For generator targets with no sources, just pass through dependencies
-    members_with_sources = [
-        t for t in request.component.members
-        if t.has_field(ClojureSourceField) or t.has_field(ClojureTestSourceField)
-    ]
+    # Collect the source field of each member in a single pass over the component
+    source_fields = []
+    for t in request.component.members:
+        if t.has_field(ClojureSourceField):
+            source_fields.append(t.get(ClojureSourceField))
+        elif t.has_field(ClojureTestSourceField):
+            source_fields.append(t.get(ClojureTestSourceField))
 
-    if not members_with_sources:
+    # For generator targets with no sources, just pass through dependencies
+    if not source_fields:
         # Generator target - merge all dependency digests
         merged_digest = await merge_digests(
             MergeDigests([cpe.digest for cpe in direct_dependency_classpath_entries]),
@@ -90,9 +93,7 @@ async def compile_clojure_source(
     # Get source files for targets with sources
     source_files = await determine_source_files(
         SourceFilesRequest(
-            (t.get(ClojureSourceField) if t.has_field(ClojureSourceField)
-             else t.get(ClojureTestSourceField)
-             for t in members_with_sources),
+            source_fields,
             for_sources_types=(ClojureSourceField, ClojureTestSourceField),
             enable_codegen=True,
         ),
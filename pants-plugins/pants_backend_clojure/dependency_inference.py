@@ -151,70 +151,91 @@ async def _infer_clojure_dependencies_impl(
     dependencies: OrderedSet[Address] = OrderedSet()
     my_resolve = field_set.resolve.normalized_value(jvm)
 
-    for namespace in required_namespaces:
-        # Strategy: Try first-party sources first, then fall back to third-party mapping
-        # This ensures that local code takes precedence over third-party libraries
-
-        # FIRST: Try first-party sources using OwnersRequest
-        # Convert namespace to expected file path
-        # e.g., "example.project-a.core" -> "example/project_a/core.clj"
-        file_path = namespace_to_path(namespace)
-
-        # Try to find owners with different path variations
-        # Since we don't know the source root, try with just the namespace path
-        # and also try **/path (glob pattern)
-        possible_paths = [
-            file_path,  # Direct path
-            f"**/{file_path}",  # Glob to find anywhere in project
-        ]
-
-        found_first_party = False
-        for path in possible_paths:
-            owners = await find_owners(OwnersRequest((path,)), **implicitly())
-            if owners:
-                # Filter owners to only those with matching resolve
-                # This handles cases where the same file has multiple targets with different resolves
-                # Get actual targets to check their resolve fields
-                owner_targets = await resolve_targets(**implicitly({Addresses(owners): Addresses}))
-
-                matching_owners = []
-                for target in owner_targets:
-                    # Check if target has a resolve field and if it matches our resolve
-                    if target.has_field(JvmResolveField):
-                        target_resolve = target[JvmResolveField].normalized_value(jvm)
-                        if target_resolve == my_resolve:
-                            matching_owners.append(target.address)
-
-                # If we found matching owners, use those; otherwise fall back to all owners
-                candidates = tuple(matching_owners) if matching_owners else owners
-
-                # Use disambiguated to handle remaining ambiguity
-                explicitly_provided_deps.maybe_warn_of_ambiguous_dependency_inference(
-                    candidates,
-                    field_set.address,
-                    import_reference="namespace",
-                    context=f"The target {field_set.address} requires `{namespace}`",
-                )
-                maybe_disambiguated = explicitly_provided_deps.disambiguated(candidates)
-                if maybe_disambiguated:
-                    dependencies.add(maybe_disambiguated)
-                found_first_party = True
-                break  # Found owners, no need to try other paths
+    # Strategy: Try first-party sources first, then fall back to third-party mapping
+    # This ensures that local code takes precedence over third-party libraries
+
+    # FIRST: Try first-party sources using OwnersRequest
+    # Convert each namespace to its expected file path
+    # e.g., "example.project-a.core" -> "example/project_a/core.clj"
+    namespaces = tuple(required_namespaces)
+    namespace_paths = [namespace_to_path(namespace) for namespace in namespaces]
+
+    # Look up owners of the direct path for every namespace in one batch
+    namespace_owners = list(
+        await concurrently(
+            find_owners(OwnersRequest((path,)), **implicitly()) for path in namespace_paths
+        )
+    )
+
+    # Since we don't know the source root, fall back to a glob to find the file
+    # anywhere in the project - but only for namespaces the direct path missed
+    unowned = [i for i, owners in enumerate(namespace_owners) if not owners]
+    if unowned:
+        glob_owners = await concurrently(
+            find_owners(OwnersRequest((f"**/{namespace_paths[i]}",)), **implicitly())
+            for i in unowned
+        )
+        for i, owners in zip(unowned, glob_owners):
+            namespace_owners[i] = owners
+
+    # Get actual targets to check their resolve fields, resolving each namespace's
+    # owners in one batch. Owners are resolved per namespace because an owner may be
+    # a target generator (find_owners reports one for a path it cannot see, as with
+    # the glob fallback), which expands to its generated targets
+    owned_namespaces = [ns for ns, owners in zip(namespaces, namespace_owners) if owners]
+    owner_targets_by_namespace: dict[str, Targets] = {}
+    if owned_namespaces:
+        owner_targets_by_namespace = dict(
+            zip(
+                owned_namespaces,
+                await concurrently(
+                    resolve_targets(**implicitly({Addresses(owners): Addresses}))
+                    for owners in namespace_owners
+                    if owners
+                ),
+            )
+        )
+
+    for namespace, owners in zip(namespaces, namespace_owners):
+        if owners:
+            # Filter owners to only those with matching resolve
+            # This handles cases where the same file has multiple targets with different resolves
+            matching_owners = []
+            for target in owner_targets_by_namespace[namespace]:
+                # Check if target has a resolve field and if it matches our resolve
+                if target.has_field(JvmResolveField):
+                    target_resolve = target[JvmResolveField].normalized_value(jvm)
+                    if target_resolve == my_resolve:
+                        matching_owners.append(target.address)
+
+            # If we found matching owners, use those; otherwise fall back to all owners
+            candidates = tuple(matching_owners) if matching_owners else owners
+
+            # Use disambiguated to handle remaining ambiguity
+            explicitly_provided_deps.maybe_warn_of_ambiguous_dependency_inference(
+                candidates,
+                field_set.address,
+                import_reference="namespace",
+                context=f"The target {field_set.address} requires `{namespace}`",
+            )
+            maybe_disambiguated = explicitly_provided_deps.disambiguated(candidates)
+            if maybe_disambiguated:
+                dependencies.add(maybe_disambiguated)
+            continue
 
         # SECOND: If no first-party source found, check third-party mapping
-        if not found_first_party:
-            third_party_addrs = clojure_mapping.addresses_for_namespace(namespace, my_resolve)
-            if third_party_addrs:
-                # Found in third-party mapping - apply same disambiguation logic
-                explicitly_provided_deps.maybe_warn_of_ambiguous_dependency_inference(
-                    third_party_addrs,
-                    field_set.address,
-                    import_reference="namespace",
-                    context=f"The target {field_set.address} requires `{namespace}`",
-                )
-                maybe_disambiguated = explicitly_provided_deps.disambiguated(third_party_addrs)
-                if maybe_disambiguated:
-                    dependencies.add(maybe_disambiguated)
+        third_party_addrs = clojure_mapping.addresses_for_namespace(namespace, my_resolve)
+        if third_party_addrs:
+            # Found in third-party mapping - apply same disambiguation logic
+            explicitly_provided_deps.maybe_warn_of_ambiguous_dependency_inference(
+                third_party_addrs,
+                field_set.address,
+                import_reference="namespace",
+                context=f"The target {field_set.address} requires `{namespace}`",
+            )
+            maybe_disambiguated = explicitly_provided_deps.disambiguated(third_party_addrs)
+            if maybe_disambiguated:
+                dependencies.add(maybe_disambiguated)
 
     # Handle Java class imports using SymbolMapping
     for class_name in imported_classes:
@@ -28,7 +28,10 @@ from pants.jvm.resolve.coursier_fetch import (
 from pants.jvm.subsystems import JvmSubsystem
 from pants.util.logging import LogLevel
 
-from pants_backend_clojure.utils.jar_analyzer import analyze_jar_for_namespaces
+from pants_backend_clojure.clojure_symbol_mapping import (
+    ClojureJarAnalysisRequest,
+    analyze_clojure_jar,
+)
 
 
 class GenerateClojureLockfileMetadataSubsystem(GoalSubsystem):
@@ -89,9 +92,6 @@ async def generate_metadata_for_resolve(
     3. Analyzes each JAR for Clojure namespaces
     4. Generates a metadata JSON file
     """
-    import tempfile
-    from pathlib import Path
-
     # Load the lockfile
     lockfile_contents = await get_digest_contents(request.lockfile_digest)
     if not lockfile_contents:
@@ -104,40 +104,30 @@ async def generate_metadata_for_resolve(
         coursier_fetch_one_coord(entry) for entry in lockfile.entries
     )
 
+    # Analyze each JAR in its own rule, shared with (and memoized alongside) the
+    # automatic namespace mapping, so unchanged artifacts are not re-analyzed
+    analyses = await concurrently(
+        analyze_clojure_jar(ClojureJarAnalysisRequest(classpath_entry.digest))
+        for classpath_entry in classpath_entries
+    )
+
     artifact_namespaces: dict[str, tuple[str, tuple[str, ...]]] = {}
     total_namespaces = 0
 
-    # Analyze each JAR
-    for entry, classpath_entry in zip(lockfile.entries, classpath_entries):
-        # Materialize the JAR to analyze it
-        jar_contents = await get_digest_contents(classpath_entry.digest)
-        if not jar_contents:
-            continue
-
-        # Write to a temp file and analyze
-        # TODO: In the future, we could make analyze_jar_for_namespaces accept bytes directly
-        with tempfile.NamedTemporaryFile(suffix='.jar', delete=False) as tmp_jar:
-            tmp_jar.write(jar_contents[0].content)
-            tmp_jar.flush()
-            jar_path = Path(tmp_jar.name)
-
-            try:
-                # Analyze the JAR for Clojure namespaces
-                analysis = analyze_jar_for_namespaces(jar_path)
-
-                if analysis.namespaces:
-                    # Build the artifact coordinate string
-                    coord_str = f"{entry.coord.group}:{entry.coord.artifact}:{entry.coord.version}"
+    for entry, analysis in zip(lockfile.entries, analyses):
+        # Build the artifact coordinate string
+        coord_str = f"{entry.coord.group}:{entry.coord.artifact}:{entry.coord.version}"
 
-                    # Use the pants_address from the lockfile entry if available
-                    address = entry.pants_address or f"<unknown for {coord_str}>"
+        # The metadata file is checked in, so never write it with an artifact missing
+        if analysis.error is not None:
+            raise ValueError(f"Could not analyze JAR for {coord_str}: {analysis.error}")
 
-                    artifact_namespaces[coord_str] = (address, analysis.namespaces)
-                    total_namespaces += len(analysis.namespaces)
+        if analysis.namespaces:
+            # Use the pants_address from the lockfile entry if available
+            address = entry.pants_address or f"<unknown for {coord_str}>"
 
-            finally:
-                # Clean up temp file
-                jar_path.unlink(missing_ok=True)
+            artifact_namespaces[coord_str] = (address, analysis.namespaces)
+            total_namespaces += len(analysis.namespaces)
 
     # Generate metadata JSON
     from pathlib import Path as PathlibPath
@@ -52,6 +52,14 @@ from pants_backend_clojure.tools_build_uberjar import (
 
 logger = logging.getLogger(__name__)
 
+# Matches :name in a gen-class declaration, e.g.
+#   (:gen-class :name com.example.MyClass)
+#   (:gen-class :init init :name com.example.MyClass :methods [...])
+_GEN_CLASS_NAME_PATTERN = re.compile(r'\(:gen-class[^)]*:name\s+([\w.-]+)', re.DOTALL)
+
+# Matches an ns declaration that contains (:gen-class)
+_NS_WITH_GEN_CLASS_PATTERN = re.compile(r'\(ns\s+[\w.-]+.*?\(:gen-class', re.DOTALL)
+
 
 def extract_main_class(main_namespace: str, source_content: str) -> str:
     """Extract the main class name from a Clojure source file.
@@ -67,14 +75,7 @@ def extract_main_class(main_namespace: str, source_content: str) -> str:
         The main class name for the manifest
     """
     # Look for :name in gen-class declaration
-    # Match patterns like:
-    #   (:gen-class :name com.example.MyClass)
-    #   (:gen-class :init init :name com.example.MyClass :methods [...])
-    gen_class_name_match = re.search(
-        r'\(:gen-class[^)]*:name\s+([\w.-]+)',
-        source_content,
-        re.DOTALL,
-    )
+    gen_class_name_match = _GEN_CLASS_NAME_PATTERN.search(source_content)
 
     if gen_class_name_match:
         return gen_class_name_match.group(1)
@@ -295,11 +296,7 @@ X-Source-Only: true
         )
 
     # Check for (:gen-class) in the namespace declaration
-    ns_with_gen_class = re.search(
-        r'\(ns\s+[\w.-]+.*?\(:gen-class',
-        main_source_file,
-        re.DOTALL,
-    )
+    ns_with_gen_class = _NS_WITH_GEN_CLASS_PATTERN.search(main_source_file)
 
     if not ns_with_gen_class:
         raise ValueError(
@@ -42,6 +42,9 @@ from pants.jvm.target_types import JvmDependenciesField, JvmJdkField
 from pants.util.logging import LogLevel
 
 
+_TEST_NAMESPACE_PATTERN = re.compile(r"\(ns\s+([a-z0-9\-_.]+)", re.MULTILINE)
+
+
 class ClojureTestSubsystem(Subsystem):
     options_scope = "clojure-test-runner"
     name = "Clojure test"
@@ -98,7 +101,7 @@ async def setup_clojure_test_for_target(
     test_file_path = test_source_files.files[0]
     digest_contents = await get_digest_contents(test_source_files.snapshot.digest)
     content = digest_contents[0].content.decode("utf-8")
-    match = re.search(r"\(ns\s+([a-z0-9\-_.]+)", content, re.MULTILINE)
+    match = _TEST_NAMESPACE_PATTERN.search(content)
     if not match:
         raise ValueError(
             f"Could not find namespace declaration in {test_file_path}.\n\n"
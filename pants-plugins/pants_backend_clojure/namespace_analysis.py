@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import json
 import logging
+import sys
 from dataclasses import dataclass
 
 from pants.core.util_rules.config_files import ConfigFiles, ConfigFilesRequest, find_config_file
@@ -102,13 +103,16 @@ async def analyze_clojure_namespaces(
         ]),
     )
 
-    # Run clj-kondo analysis in batch mode on all files
+    # Run clj-kondo analysis in batch mode on all files. With more than one file,
+    # --parallel lets clj-kondo analyze them on multiple threads within the one process.
+    parallel_args = ["--parallel"] if len(request.snapshot.files) > 1 else []
     result = await execute_process(
         Process(
             argv=[
                 downloaded.exe,
                 "--lint",
                 *request.snapshot.files,
+                *parallel_args,
                 "--config",
                 "{:output {:analysis {:java-class-usages true} :format :json}}",
             ],
@@ -140,7 +144,9 @@ async def analyze_clojure_namespaces(
             imports=FrozenDict({}),
         )
 
-    # Build result mappings using relative file paths
+    # Build result mappings using relative file paths. Namespace and class names are
+    # interned: the same few (clojure.string, java.util.List, ...) recur in every
+    # file's result, and these results stay memoized for the life of pantsd.
     namespaces: dict[str, str] = {}
     requires_dict: dict[str, list[str]] = {}
     imports_dict: dict[str, list[str]] = {}
@@ -148,16 +154,16 @@ async def analyze_clojure_namespaces(
     for ns_def in analysis.get("namespace-definitions", []):
         # clj-kondo returns paths relative to working directory
         path = ns_def["filename"]
-        namespaces[path] = ns_def["name"]
+        namespaces[path] = sys.intern(ns_def["name"])
 
     for ns_usage in analysis.get("namespace-usages", []):
         path = ns_usage["filename"]
-        requires_dict.setdefault(path, []).append(ns_usage["to"])
+        requires_dict.setdefault(path, []).append(sys.intern(ns_usage["to"]))
 
     for java_usage in analysis.get("java-class-usages", []):
         if java_usage.get("import"):
             path = java_usage["filename"]
-            imports_dict.setdefault(path, []).append(java_usage["class"])
+            imports_dict.setdefault(path, []).append(sys.intern(java_usage["class"]))
 
     return ClojureNamespaceAnalysis(
         namespaces=FrozenDict(namespaces),
@@ -30,6 +30,13 @@ from pants.jvm.target_types import (
     OutputPathField,
 )
 
+from pants_backend_clojure.config import CLOJURE_TEST_PATTERNS
+
+# Default `sources` globs for the generator targets. The include/exclude split is
+# computed once at import time rather than re-derived from a mixed tuple.
+_DEFAULT_SOURCE_INCLUDES = ("*.clj", "*.cljc")
+_DEFAULT_SOURCE_EXCLUDES = CLOJURE_TEST_PATTERNS
+
 
 class ClojureSourceField(SingleSourceField):
     expected_file_extensions = (".clj", ".cljc")
@@ -108,15 +115,8 @@ class ClojureSourceTarget(Target):
 
 
 class ClojureSourcesGeneratorSourcesField(ClojureGeneratorSourcesField):
-    default = (
-        "*.clj",
-        "*.cljc",
-        # Exclude test files by default
-        "!*_test.clj",
-        "!*_test.cljc",
-        "!test_*.clj",
-        "!test_*.cljc",
-    )
+    # Exclude test files by default
+    default = _DEFAULT_SOURCE_INCLUDES + tuple(f"!{p}" for p in _DEFAULT_SOURCE_EXCLUDES)
     help = generate_multiple_sources_field_help_message(
         "Example: `sources=['Example.clj', 'New*.clj', '!OldExample.clj']`"
     )
@@ -175,7 +175,7 @@ class ClojureTestTarget(Target):
 
 
 class ClojureTestsGeneratorSourcesField(ClojureGeneratorSourcesField):
-    default = ("*_test.clj", "*_test.cljc", "test_*.clj", "test_*.cljc")
+    default = CLOJURE_TEST_PATTERNS
     help = generate_multiple_sources_field_help_message(
         "Example: `sources=['*_test.clj', '!skip_test.clj']`"
     )
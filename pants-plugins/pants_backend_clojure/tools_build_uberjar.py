@@ -94,38 +94,44 @@ def generate_build_script(
 (def exclusion-patterns [{exclusion_vec}])
 (def provided-jar-prefixes [{jar_prefixes_vec}])
 
+;; All provided prefixes compiled once into a single anchored alternation,
+;; so each JAR name is checked with one re-find instead of one test per prefix
+(def provided-jar-pattern
+  (when (seq provided-jar-prefixes)
+    (re-pattern (str "^(?:" (str/join "|" (map #(java.util.regex.Pattern/quote %) provided-jar-prefixes)) ")"))))
+
 (defn list-jars
-  "List all JAR files in a directory, returning relative paths."
+  "List all JAR files in a directory, returning relative paths.
+  Streams the directory through NIO rather than materializing a File[]."
   [dir]
-  (let [dir-file (io/file dir)]
-    (if (.exists dir-file)
-      (->> (.listFiles dir-file)
-           (filter #(and (.isFile %) (.endsWith (.getName %) ".jar")))
-           (map #(str dir "/" (.getName %)))
-           vec)
+  (let [dir-path (java.nio.file.Paths/get dir (into-array String []))]
+    (if (java.nio.file.Files/isDirectory dir-path (into-array java.nio.file.LinkOption []))
+      (with-open [stream (java.nio.file.Files/newDirectoryStream dir-path "*.jar")]
+        (into [] (keep #(when (java.nio.file.Files/isRegularFile % (into-array java.nio.file.LinkOption []))
+                          (str dir "/" (.getFileName ^java.nio.file.Path %))))
+              stream))
       [])))
 
-(defn jar-matches-prefix?
-  "Check if a JAR path matches any of the provided prefixes."
-  [jar-path prefixes]
-  (let [jar-name (-> (io/file jar-path) .getName)]
-    (some #(str/starts-with? jar-name %) prefixes)))
+(defn jar-name
+  "Return the file name of a relative JAR path without allocating a File."
+  [^String jar-path]
+  (subs jar-path (inc (.lastIndexOf jar-path "/"))))
 
-(defn filter-provided-jars
-  "Filter out JARs whose filenames start with any of the provided prefixes."
-  [jar-paths prefixes]
-  (if (empty? prefixes)
-    jar-paths
-    (filterv #(not (jar-matches-prefix? % prefixes)) jar-paths)))
+(defn provided-jar?
+  "Check if a JAR's filename matches the provided JAR prefix pattern."
+  [jar-path]
+  (and provided-jar-pattern (re-find provided-jar-pattern (jar-name jar-path))))
 
 (defn build-libs-map
-  "Build a libs map for tools.build uber function.
-  The uber function expects {{:libs {{lib-sym {{:paths [...jars...]}}}}}}."
+  "Build a libs map for tools.build uber function, skipping provided JARs.
+  The uber function expects {{:libs {{lib-sym {{:paths [...jars...]}}}}}}.
+  Filtering and indexing run as one transducer pass over the JAR paths."
   [jar-paths]
-  (into {{}} (map-indexed
-               (fn [idx path]
-                 [(symbol (str "dep" idx)) {{:paths [path]}}])
-               jar-paths)))
+  (into {{}}
+        (comp (remove provided-jar?)
+              (map-indexed (fn [idx path]
+                             [(symbol (str "dep" idx)) {{:paths [path]}}])))
+        jar-paths))
 
 (defn uberjar [_]
   (try
@@ -133,8 +139,8 @@ def generate_build_script(
     ;; provided-src contains sources needed for compilation but not packaging
     (let [compile-jars (list-jars "compile-libs")
           all-uber-jars (list-jars "uber-libs")
-          ;; Filter out provided JARs from uber-libs
-          uber-jars (filter-provided-jars all-uber-jars provided-jar-prefixes)
+          ;; Runtime libs with provided JARs filtered out of uber-libs
+          uber-libs (build-libs-map all-uber-jars)
           ;; Include provided-src in compile classpath so transitive deps resolve,
           ;; but only compile src-dirs (not provided-src)
           compile-cp (vec (concat ["src" "provided-src"] [class-dir] compile-jars))
@@ -142,10 +148,10 @@ def generate_build_script(
           ;; compile-clj uses :classpath-roots
           compile-basis {{:classpath-roots compile-cp}}
           ;; uber uses :libs map where each lib has :paths
-          uber-basis {{:libs (build-libs-map uber-jars)}}]
+          uber-basis {{:libs uber-libs}}]
 
       (println "compile-libs:" (count compile-jars) "JARs")
-      (println "uber-libs:" (count all-uber-jars) "JARs," (- (count all-uber-jars) (count uber-jars)) "excluded")
+      (println "uber-libs:" (count all-uber-jars) "JARs," (- (count all-uber-jars) (count uber-libs)) "excluded")
 
       ;; Clean previous output
       (b/delete {{:path class-dir}})
@@ -270,34 +276,25 @@ async def build_uberjar_with_tools_build(
     #   compile-libs/       <- All JARs including provided (for AOT)
     #   uber-libs/          <- Runtime JARs excluding provided (for packaging)
 
-    build_script_digest = await create_digest(
-        CreateDigest([FileContent("build.clj", build_script.encode())]),
+    # Everything below is independent, so request it from the engine in one
+    # round trip. Classpath entries are prefixed one digest at a time (each
+    # memoized on its own) and merged only once, with the rest of the tree.
+    layout_digests = await concurrently(
+        [
+            create_digest(CreateDigest([FileContent("build.clj", build_script.encode())])),
+            # Put runtime sources under src/ (these get compiled and packaged)
+            add_prefix(AddPrefix(request.source_digest, "src")),
+            # Put provided sources under provided-src/ (on classpath for compilation, not packaged)
+            add_prefix(AddPrefix(request.provided_source_digest, "provided-src")),
+            # Put compile-time JARs under compile-libs/
+            *(add_prefix(AddPrefix(digest, "compile-libs")) for digest in request.compile_classpath.digests()),
+            # Put runtime JARs under uber-libs/
+            *(add_prefix(AddPrefix(digest, "uber-libs")) for digest in request.runtime_classpath.digests()),
+        ]
     )
 
-    # Put runtime sources under src/ (these get compiled and packaged)
-    src_digest = await add_prefix(AddPrefix(request.source_digest, "src"))
-
-    # Put provided sources under provided-src/ (on classpath for compilation, not packaged)
-    provided_src_digest = await add_prefix(AddPrefix(request.provided_source_digest, "provided-src"))
-
-    # Put compile-time JARs under compile-libs/
-    compile_jars_digest = await merge_digests(MergeDigests(request.compile_classpath.digests()))
-    compile_libs_digest = await add_prefix(AddPrefix(compile_jars_digest, "compile-libs"))
-
-    # Put runtime JARs under uber-libs/
-    runtime_jars_digest = await merge_digests(MergeDigests(request.runtime_classpath.digests()))
-    uber_libs_digest = await add_prefix(AddPrefix(runtime_jars_digest, "uber-libs"))
-
     # Merge everything
-    input_digest = await merge_digests(
-        MergeDigests([
-            build_script_digest,
-            src_digest,
-            provided_src_digest,
-            compile_libs_digest,
-            uber_libs_digest,
-        ]),
-    )
+    input_digest = await merge_digests(MergeDigests(layout_digests))
 
     # 4. Run tools.build
     # NOTE: tools_classpath contains tools.build + ALL its transitive deps:
@@ -330,6 +327,10 @@ async def build_uberjar_with_tools_build(
         extra_nailgun_keys=(),
         output_directories=(),
         cache_scope=None,
+        # Not nailgunned: build.clj ends with System/exit, and tools.build resolves
+        # its relative paths (src/, compile-libs/, app.jar) against the JVM's
+        # working directory, which a long-lived nailgun server does not change
+        # per request.
         use_nailgun=False,
     )
 
@@ -13,6 +13,7 @@ The analysis handles:
 
 from __future__ import annotations
 
+import io
 import zipfile
 from dataclasses import dataclass
 from pathlib import Path
@@ -20,19 +21,37 @@ from pathlib import Path
 import re
 
 
+# Number of leading bytes read from each source file when looking for its ns form.
+_NS_HEAD_BYTES = 8192
+
+# Largest source file that is re-read in full when its head has no ns form.
+# Bigger .clj entries are generated data or resource templates, not namespaces.
+_NS_FULL_READ_MAX_BYTES = 128 * 1024
+
+
+# Top-level package prefixes of common Clojure libraries, used by is_clojure_jar
+# to recognise AOT-compiled classes without any source files alongside them.
+_CLOJURE_LIB_PREFIXES = (
+    'clojure/', 'cljs/', 'cljc/',  # Core Clojure namespaces
+    'medley/', 'ring/', 'compojure/',  # Common libraries
+)
+
+
 # Simple regex pattern to extract namespace from Clojure source files.
 # This pattern handles the common case of (ns namespace-name ...) at the start.
 # For JAR analysis (third-party dependencies), this is sufficient since most
 # libraries use standard namespace declarations. Complex edge cases are rare
 # in published JAR files.
+# The pattern is ASCII-only, so it runs directly on the raw entry bytes; only the
+# captured name is decoded, rather than the whole file.
 _NS_PATTERN = re.compile(
-    r'^\s*\(ns\s+([a-zA-Z][a-zA-Z0-9_.\-]*)',
+    rb'^\s*\(ns\s+([a-zA-Z][a-zA-Z0-9_.\-]*)',
     re.MULTILINE
 )
 
 
-def _parse_namespace_simple(source_content: str) -> str | None:
-    """Parse namespace from Clojure source using simple regex.
+def _parse_namespace_simple(source_content: bytes) -> str | None:
+    """Parse namespace from raw Clojure source bytes using simple regex.
 
     This is a lightweight parser for JAR analysis. It handles the common case
     where namespace declarations appear at the start of the file in standard
@@ -46,7 +65,7 @@ def _parse_namespace_simple(source_content: str) -> str | None:
     """
     match = _NS_PATTERN.search(source_content)
     if match:
-        return match.group(1)
+        return match.group(1).decode('ascii')
     return None
 
 
@@ -101,7 +120,7 @@ def namespace_from_class_path(class_path: str) -> str | None:
     return namespace
 
 
-def analyze_jar_for_namespaces(jar_path: Path) -> JarNamespaceAnalysis:
+def analyze_jar_for_namespaces(jar: Path | bytes) -> JarNamespaceAnalysis:
     """Extract Clojure namespaces from a JAR file.
 
     This function inspects a JAR file to discover which Clojure namespaces
@@ -115,7 +134,8 @@ def analyze_jar_for_namespaces(jar_path: Path) -> JarNamespaceAnalysis:
     4. Return deduplicated, sorted list of namespaces
 
     Args:
-        jar_path: Path to the JAR file to analyze.
+        jar: Path to the JAR file to analyze, or the JAR's raw bytes (e.g. the
+            content of a fetched classpath digest, which then never touches disk).
 
     Returns:
         JarNamespaceAnalysis containing the discovered namespaces.
@@ -135,19 +155,49 @@ def analyze_jar_for_namespaces(jar_path: Path) -> JarNamespaceAnalysis:
     namespaces = set()
 
     try:
-        with zipfile.ZipFile(jar_path, 'r') as jar:
-            # First pass: Look for Clojure source files
-            source_files = [
-                name for name in jar.namelist()
-                if name.endswith(('.clj', '.cljc', '.clje')) and not name.startswith('META-INF/')
-            ]
+        with zipfile.ZipFile(io.BytesIO(jar) if isinstance(jar, bytes) else jar, 'r') as jar:
+            # Single pass over the central directory: bucket entries into
+            # Clojure sources and AOT namespace loader classes
+            source_files = []
+            class_namespaces = set()
+            for info in jar.infolist():
+                name = info.filename
+                if name.startswith('META-INF/'):
+                    continue
+                if name.endswith(('.clj', '.cljc', '.clje')):
+                    source_files.append(info)
+                elif not source_files and name.endswith('.class'):
+                    # Class files only matter while no sources have been seen
+                    ns = namespace_from_class_path(name)
+                    if ns:
+                        class_namespaces.add(ns)
 
             if source_files:
                 # We have source files - parse them for namespace declarations
                 for entry in source_files:
                     try:
-                        content = jar.read(entry).decode('utf-8', errors='ignore')
-                        ns = _parse_namespace_simple(content)
+                        # The ns form sits at the top of the file, so only inflate
+                        # and scan its head
+                        with jar.open(entry) as fp:
+                            head = fp.read(_NS_HEAD_BYTES)
+                        match = _NS_PATTERN.search(head)
+                        head_is_truncated = len(head) == _NS_HEAD_BYTES
+
+                        if head_is_truncated and match and match.end() == len(head):
+                            # The name runs up to the cut and may itself be truncated
+                            ns = _parse_namespace_simple(jar.read(entry))
+                        elif (
+                            head_is_truncated
+                            and not match
+                            and entry.file_size <= _NS_FULL_READ_MAX_BYTES
+                        ):
+                            # No ns form in the head, but the file is small enough
+                            # to plausibly be a namespace with a long preamble
+                            ns = _parse_namespace_simple(jar.read(entry))
+                        elif match:
+                            ns = match.group(1).decode('ascii')
+                        else:
+                            ns = None
                         if ns:
                             namespaces.add(ns)
                     except Exception:
@@ -155,16 +205,8 @@ def analyze_jar_for_namespaces(jar_path: Path) -> JarNamespaceAnalysis:
                         # Common reasons: corrupt files, non-UTF8 encoding, etc.
                         pass
             else:
-                # No source files - fall back to analyzing class files
-                class_files = [
-                    name for name in jar.namelist()
-                    if name.endswith('.class') and not name.startswith('META-INF/')
-                ]
-
-                for entry in class_files:
-                    ns = namespace_from_class_path(entry)
-                    if ns:
-                        namespaces.add(ns)
+                # No source files - fall back to the namespaces of AOT-compiled classes
+                namespaces = class_namespaces
 
     except zipfile.BadZipFile:
         # Not a valid ZIP/JAR file - return empty result
@@ -202,14 +244,14 @@ def is_clojure_jar(jar_path: Path) -> bool:
                 if name.endswith(('.clj', '.cljc', '.clje')):
                     return True
                 # Check for Clojure class files (common namespace prefixes)
-                if name.endswith('.class') and not '__' in name and not '$' in name:
-                    # This is a heuristic - any .class file could be Clojure
-                    # Common Clojure library prefixes
-                    if any(name.startswith(prefix) for prefix in [
-                        'clojure/', 'cljs/', 'cljc/',  # Core Clojure namespaces
-                        'medley/', 'ring/', 'compojure/',  # Common libraries
-                    ]):
-                        return True
+                # This is a heuristic - any .class file could be Clojure
+                if (
+                    name.endswith('.class')
+                    and name.startswith(_CLOJURE_LIB_PREFIXES)
+                    and '__' not in name
+                    and '$' not in name
+                ):
+                    return True
     except Exception:
         pass
 
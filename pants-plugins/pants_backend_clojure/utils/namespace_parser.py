@@ -2,6 +2,8 @@
 
 This module provides utility functions for converting between Clojure
 namespace names and file paths, as well as checking for JDK classes.
+The conversions are pure and memoized, since the same namespaces (e.g.
+clojure.string) recur across every target in a build.
 
 For parsing Clojure source files to extract namespaces, requires, and imports,
 use the ClojureNamespaceAnalysis rule from pants_backend_clojure.namespace_analysis,
@@ -10,7 +12,12 @@ which properly invokes clj-kondo inside the Pants sandbox.
 
 from __future__ import annotations
 
+import functools
 
+from pants_backend_clojure.config import JDK_PACKAGE_PREFIXES
+
+
+@functools.lru_cache(maxsize=8192)
 def namespace_to_path(namespace: str) -> str:
     """Convert a Clojure namespace to its expected file path.
 
@@ -27,9 +34,10 @@ def namespace_to_path(namespace: str) -> str:
         Clojure uses underscores in file paths for hyphens in namespaces.
     """
     path = namespace.replace('.', '/').replace('-', '_')
-    return f"{path}.clj"
+    return path + '.clj'
 
 
+@functools.lru_cache(maxsize=8192)
 def path_to_namespace(file_path: str) -> str:
     """Convert a file path to a Clojure namespace.
 
@@ -57,6 +65,7 @@ def path_to_namespace(file_path: str) -> str:
     return namespace
 
 
+@functools.lru_cache(maxsize=8192)
 def class_to_path(class_name: str) -> str:
     """Convert a Java class name to its expected file path.
 
@@ -75,11 +84,10 @@ def class_to_path(class_name: str) -> str:
         Inner classes (containing $) are mapped to their outer class file.
     """
     # Handle inner classes by taking only the outer class
-    if '$' in class_name:
-        class_name = class_name.split('$')[0]
+    class_name = class_name.partition('$')[0]
 
     path = class_name.replace('.', '/')
-    return f"{path}.java"
+    return path + '.java'
 
 
 def is_jdk_class(class_name: str) -> bool:
@@ -97,6 +105,4 @@ def is_jdk_class(class_name: str) -> bool:
         - sun.* (internal, discouraged but sometimes used)
         - jdk.* (JDK 9+ modules)
     """
-    from pants_backend_clojure.config import JDK_PACKAGE_PREFIXES
-
-    return any(class_name.startswith(prefix) for prefix in JDK_PACKAGE_PREFIXES)
+    return class_name.startswith(JDK_PACKAGE_PREFIXES)
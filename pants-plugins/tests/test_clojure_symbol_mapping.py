@@ -4,7 +4,16 @@ from __future__ import annotations
 
 import pytest
 
+from pants.engine.addresses import Address
+from pants.jvm.dependency_inference.artifact_mapper import (
+    DEFAULT_SYMBOL_NAMESPACE,
+    MutableTrieNode,
+)
+from pants.util.frozendict import FrozenDict
+
+from pants_backend_clojure import clojure_symbol_mapping
 from pants_backend_clojure.clojure_symbol_mapping import (
+    ClojureNamespaceMapping,
     _namespace_matches_pattern,
 )
 
@@ -69,9 +78,52 @@ class TestNamespaceMatchesPattern:
 
 
 class TestClojureNamespaceMapping:
-    """Integration tests for ClojureNamespaceMapping would go here.
+    """Tests for ClojureNamespaceMapping lookups on a hand-built trie.
 
-    These would require a full RuleRunner setup with JVM subsystem configuration,
-    which is more involved. The basic tests above verify the pattern matching logic.
+    Building the mapping from lockfiles requires a full RuleRunner setup with JVM
+    subsystem configuration; these tests only exercise the lookup side.
     """
-    pass
+
+    DATA_JSON = Address("3rdparty/jvm", target_name="data-json")
+    RING_CORE = Address("3rdparty/jvm", target_name="ring-core")
+
+    def _mapping(self) -> ClojureNamespaceMapping:
+        trie = MutableTrieNode()
+        trie.insert(
+            "clojure.data.json",
+            [self.DATA_JSON],
+            first_party=False,
+            recursive=False,
+            namespace=DEFAULT_SYMBOL_NAMESPACE,
+        )
+        trie.insert(
+            "ring",
+            [self.RING_CORE],
+            first_party=False,
+            recursive=True,
+            namespace=DEFAULT_SYMBOL_NAMESPACE,
+        )
+        return ClojureNamespaceMapping(mapping_per_resolve=FrozenDict({"default": trie.frozen()}))
+
+    def test_repeat_lookups_return_same_result(self) -> None:
+        """Test that memoized hits and misses match the first lookup."""
+        mapping = self._mapping()
+        for namespace, expected in [
+            ("clojure.data.json", (self.DATA_JSON,)),
+            ("ring.middleware.cookies", (self.RING_CORE,)),
+            ("unknown.namespace", ()),
+        ]:
+            assert mapping.addresses_for_namespace(namespace, "default") == expected
+            assert mapping.addresses_for_namespace(namespace, "default") == expected
+        assert mapping.addresses_for_namespace("clojure.data.json", "other") == ()
+
+    def test_lookup_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that lookups past the cache bound are answered but not stored."""
+        monkeypatch.setattr(clojure_symbol_mapping, "_LOOKUP_CACHE_MAX_ENTRIES", 2)
+        mapping = self._mapping()
+        for i in range(5):
+            assert mapping.addresses_for_namespace(f"unknown.ns{i}", "default") == ()
+        assert mapping.addresses_for_namespace("clojure.data.json", "default") == (
+            self.DATA_JSON,
+        )
+        assert len(mapping._lookup_cache) == 2
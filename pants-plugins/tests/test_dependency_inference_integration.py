@@ -258,3 +258,131 @@ def test_infer_clojure_test_dependency(rule_runner: RuleRunner) -> None:
     )
 
 
+@maybe_skip_jdk_test
+def test_third_party_require_not_claimed_by_recursive_generator(rule_runner: RuleRunner) -> None:
+    """Test that a `**/*.clj` generator does not shadow the third-party mapping.
+
+    With every BUILD directory a source root, a namespace that has no file in the
+    repo must still resolve to its jvm_artifact rather than to a generator whose
+    recursive sources glob happens to cover the candidate path.
+
+    This only guards against resolving owners by globbing every source root for
+    the candidate path. The generator here lives under src/, so owner lookup by
+    the direct path never reaches it and the test also passes without that change.
+    """
+    rule_runner.set_options(
+        ["--source-marker-filenames=['BUILD']"], env_inherit=PYTHON_BOOTSTRAP_ENV
+    )
+    rule_runner.write_files(
+        {
+            "3rdparty/jvm/BUILD": dedent(
+                """\
+                jvm_artifact(
+                    name="data-json",
+                    group="org.clojure",
+                    artifact="data.json",
+                    version="2.5.0",
+                    packages=["clojure.data.json"],
+                )
+                """
+            ),
+            "3rdparty/jvm/default.lock": "# Empty lockfile for testing\n",
+            "src/BUILD": "clojure_sources(sources=['**/*.clj'])\n",
+            "src/my/app/util.clj": dedent(
+                """\
+                (ns my.app.util)
+
+                (defn add [a b]
+                  (+ a b))
+                """
+            ),
+            "src/my/app/core.clj": dedent(
+                """\
+                (ns my.app.core
+                  (:require [clojure.data.json :as json]
+                            [my.app.util :as util]))
+
+                (defn run []
+                  (json/write-str {:sum (util/add 2 3)}))
+                """
+            ),
+        }
+    )
+
+    core_target = rule_runner.get_target(
+        Address("src", relative_file_path="my/app/core.clj")
+    )
+
+    from pants_backend_clojure.dependency_inference import ClojureSourceDependenciesInferenceFieldSet
+
+    inferred = rule_runner.request(
+        InferredDependencies,
+        [
+            InferClojureSourceDependencies(
+                ClojureSourceDependenciesInferenceFieldSet.create(core_target)
+            )
+        ],
+    )
+
+    assert inferred == InferredDependencies(
+        [
+            Address("3rdparty/jvm", target_name="data-json"),
+            Address("src", relative_file_path="my/app/util.clj"),
+        ]
+    )
+
+
+@maybe_skip_jdk_test
+def test_generator_owner_is_expanded_not_inferred(rule_runner: RuleRunner) -> None:
+    """Test that a target generator reported as an owner is never inferred itself.
+
+    For a path that does not exist, find_owners reports the ancestor generator whose
+    sources glob covers it - here the root-level `**/*.clj` generator claims
+    `clojure/data/json.clj`. Its generated targets must be resolve-checked and
+    disambiguated like any other owners, rather than the generator's own address
+    leaking into the inferred dependencies.
+    """
+    rule_runner.write_files(
+        {
+            "3rdparty/jvm/default.lock": "# Empty lockfile for testing\n",
+            "BUILD": "clojure_sources(name='lib', sources=['**/*.clj'])\n",
+            "my/app/util.clj": dedent(
+                """\
+                (ns my.app.util)
+
+                (defn add [a b]
+                  (+ a b))
+                """
+            ),
+            "my/app/core.clj": dedent(
+                """\
+                (ns my.app.core
+                  (:require [clojure.data.json :as json]
+                            [my.app.util :as util]))
+
+                (defn run []
+                  (json/write-str {:sum (util/add 2 3)}))
+                """
+            ),
+        }
+    )
+
+    core_target = rule_runner.get_target(
+        Address("", target_name="lib", relative_file_path="my/app/core.clj")
+    )
+
+    from pants_backend_clojure.dependency_inference import ClojureSourceDependenciesInferenceFieldSet
+
+    inferred = rule_runner.request(
+        InferredDependencies,
+        [
+            InferClojureSourceDependencies(
+                ClojureSourceDependenciesInferenceFieldSet.create(core_target)
+            )
+        ],
+    )
+
+    assert Address("", target_name="lib") not in inferred.include
+    assert inferred == InferredDependencies(
+        [Address("", target_name="lib", relative_file_path="my/app/util.clj")]
+    )
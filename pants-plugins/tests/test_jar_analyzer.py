@@ -10,6 +10,7 @@ from pathlib import Path
 
 import pytest
 
+from pants_backend_clojure.utils import jar_analyzer
 from pants_backend_clojure.utils.jar_analyzer import (
     analyze_jar_for_namespaces,
     is_clojure_jar,
@@ -92,6 +93,19 @@ def test_analyze_jar_with_single_clj_source():
         jar_path.unlink()
 
 
+def test_analyze_jar_from_bytes():
+    """Test analyzing a JAR passed as raw bytes rather than a path."""
+    jar_path = create_test_jar({
+        "clojure/data/json.clj": "(ns clojure.data.json)",
+    })
+
+    try:
+        result = analyze_jar_for_namespaces(jar_path.read_bytes())
+        assert result.namespaces == ("clojure.data.json",)
+    finally:
+        jar_path.unlink()
+
+
 def test_analyze_jar_with_multiple_clj_sources():
     """Test analyzing a JAR with multiple Clojure source files."""
     jar_path = create_test_jar({
@@ -287,6 +301,51 @@ def test_analyze_jar_with_non_utf8():
         jar_path.unlink()
 
 
+def test_analyze_jar_with_namespace_after_long_header():
+    """Test that an ns form beyond the initial read window is still found."""
+    header = ";; license header\n" * 1000
+    jar_path = create_test_jar({
+        "example/late.clj": header + "(ns example.late)",
+    })
+
+    try:
+        result = analyze_jar_for_namespaces(jar_path)
+        assert result.namespaces == ("example.late",)
+    finally:
+        jar_path.unlink()
+
+
+def test_analyze_jar_with_namespace_straddling_head():
+    """Test that an ns name cut off by the initial read window is read in full."""
+    # Pad a comment header so the head ends right after "(ns example.str"
+    cut = "(ns example.str"
+    header = ";" * (jar_analyzer._NS_HEAD_BYTES - len(cut) - 1) + "\n"
+    jar_path = create_test_jar({
+        "example/straddle.clj": header + "(ns example.straddle)\n",
+    })
+
+    try:
+        result = analyze_jar_for_namespaces(jar_path)
+        assert result.namespaces == ("example.straddle",)
+    finally:
+        jar_path.unlink()
+
+
+def test_analyze_jar_skips_oversized_source_without_leading_ns():
+    """Test that a huge source entry with no ns form in its head is not read in full."""
+    data = ";; generated data\n" * 10000
+    jar_path = create_test_jar({
+        "example/data.clj": data + "(ns example.data)",
+        "example/core.clj": "(ns example.core)",
+    })
+
+    try:
+        result = analyze_jar_for_namespaces(jar_path)
+        assert result.namespaces == ("example.core",)
+    finally:
+        jar_path.unlink()
+
+
 def test_analyze_invalid_jar():
     """Test analyzing a corrupted/invalid JAR file."""
     # Create a file that's not a valid ZIP/JAR
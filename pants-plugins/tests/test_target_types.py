@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from textwrap import dedent
+from itertools import chain
 
 import pytest
 
@@ -57,6 +57,47 @@ _JVM_RESOLVES = {
     "java21": "locks/jvm/java21.lock.jsonc",
 }
 
+_BUILD_RESOLVE = 'clojure_sources(name="lib", resolve="java17")\n'
+_BUILD_JDK = 'clojure_sources(name="lib", jdk="17")\n'
+_BUILD_DEPS = 'clojure_sources(name="lib", dependencies=["//3rdparty/jvm:clojure"])\n'
+
+_DEPLOY_JAR_BUILD_MINIMAL = """\
+clojure_source(name="core", source="core.clj")
+
+clojure_deploy_jar(
+    name="app",
+    main="my.app.core",
+    dependencies=[":core"],
+)
+"""
+
+_DEPLOY_JAR_BUILD_RESOLVE = """\
+clojure_source(name="core", source="core.clj", resolve="java17")
+
+clojure_deploy_jar(
+    name="app",
+    main="my.app.core",
+    dependencies=[":core"],
+    resolve="java17",
+)
+"""
+
+_DEPLOY_JAR_BUILD_JDK = """\
+clojure_source(name="core", source="core.clj")
+
+clojure_deploy_jar(
+    name="app",
+    main="my.app.core",
+    dependencies=[":core"],
+    jdk="17",
+)
+"""
+
+
+def _generated_targets(parametrizations: _TargetParametrizations) -> set[Target]:
+    """Flatten the targets produced across all parametrizations."""
+    return set(chain.from_iterable(p.parametrization.values() for p in parametrizations))
+
 
 def assert_generated(
     rule_runner: RuleRunner,
@@ -82,9 +123,7 @@ def assert_generated(
             ),
         ],
     )
-    assert expected_targets == {
-        t for parametrization in parametrizations for t in parametrization.parametrization.values()
-    }
+    assert expected_targets == _generated_targets(parametrizations)
 
 
 def test_clojure_source_field_extensions() -> None:
@@ -138,9 +177,7 @@ def test_generate_clojure_source_targets(rule_runner: RuleRunner) -> None:
     )
 
     # The generator should create individual targets for each .clj and .cljc file
-    generated_targets = {
-        t for parametrization in parametrizations for t in parametrization.parametrization.values()
-    }
+    generated_targets = _generated_targets(parametrizations)
 
     # Check that we got three targets (one for each file)
     assert len(generated_targets) == 3
@@ -155,11 +192,11 @@ def test_generate_clojure_source_targets(rule_runner: RuleRunner) -> None:
 
 def test_clojure_source_with_resolve(rule_runner: RuleRunner) -> None:
     """Test that clojure_source respects the resolve field."""
-    rule_runner.write_files({"src/clj/BUILD": 'clojure_sources(name="lib", resolve="java17")\n', "src/clj/example.clj": ""})
+    rule_runner.write_files({"src/clj/BUILD": _BUILD_RESOLVE, "src/clj/example.clj": ""})
     assert_generated(
         rule_runner,
         Address("src/clj", target_name="lib"),
-        build_content='clojure_sources(name="lib", resolve="java17")\n',
+        build_content=_BUILD_RESOLVE,
         expected_targets={
             ClojureSourceTarget(
                 {
@@ -174,11 +211,11 @@ def test_clojure_source_with_resolve(rule_runner: RuleRunner) -> None:
 
 def test_clojure_source_with_jdk(rule_runner: RuleRunner) -> None:
     """Test that clojure_source respects the jdk field."""
-    rule_runner.write_files({"src/clj/BUILD": 'clojure_sources(name="lib", jdk="17")\n', "src/clj/example.clj": ""})
+    rule_runner.write_files({"src/clj/BUILD": _BUILD_JDK, "src/clj/example.clj": ""})
     assert_generated(
         rule_runner,
         Address("src/clj", target_name="lib"),
-        build_content='clojure_sources(name="lib", jdk="17")\n',
+        build_content=_BUILD_JDK,
         expected_targets={
             ClojureSourceTarget(
                 {
@@ -193,11 +230,11 @@ def test_clojure_source_with_jdk(rule_runner: RuleRunner) -> None:
 
 def test_clojure_source_with_dependencies(rule_runner: RuleRunner) -> None:
     """Test that clojure_source respects the dependencies field."""
-    rule_runner.write_files({"src/clj/BUILD": 'clojure_sources(name="lib", dependencies=["//3rdparty/jvm:clojure"])\n', "src/clj/example.clj": ""})
+    rule_runner.write_files({"src/clj/BUILD": _BUILD_DEPS, "src/clj/example.clj": ""})
     assert_generated(
         rule_runner,
         Address("src/clj", target_name="lib"),
-        build_content='clojure_sources(name="lib", dependencies=["//3rdparty/jvm:clojure"])\n',
+        build_content=_BUILD_DEPS,
         expected_targets={
             ClojureSourceTarget(
                 {
@@ -236,9 +273,7 @@ def test_clojure_sources_excludes_test_files(rule_runner: RuleRunner) -> None:
         ],
     )
 
-    generated_targets = {
-        t for parametrization in parametrizations for t in parametrization.parametrization.values()
-    }
+    generated_targets = _generated_targets(parametrizations)
 
     # Should only have one target (example.clj), not the test file
     assert len(generated_targets) == 1
@@ -300,9 +335,7 @@ def test_generate_clojure_test_targets(rule_runner: RuleRunner) -> None:
         ],
     )
 
-    generated_targets = {
-        t for parametrization in parametrizations for t in parametrization.parametrization.values()
-    }
+    generated_targets = _generated_targets(parametrizations)
 
     assert len(generated_targets) == 2
     assert all(isinstance(t, ClojureTestTarget) for t in generated_targets)
@@ -412,17 +445,7 @@ def test_clojure_deploy_jar_with_minimal_config(rule_runner: RuleRunner) -> None
     """Test creating a clojure_deploy_jar with minimal configuration."""
     rule_runner.write_files(
         {
-            "src/BUILD": dedent(
-                """\
-                clojure_source(name="core", source="core.clj")
-
-                clojure_deploy_jar(
-                    name="app",
-                    main="my.app.core",
-                    dependencies=[":core"],
-                )
-                """
-            ),
+            "src/BUILD": _DEPLOY_JAR_BUILD_MINIMAL,
             "src/core.clj": "(ns my.app.core (:gen-class))",
         }
     )
@@ -446,18 +469,7 @@ def test_clojure_deploy_jar_with_resolve(rule_runner: RuleRunner) -> None:
     """Test creating a clojure_deploy_jar with a specific resolve."""
     rule_runner.write_files(
         {
-            "src/BUILD": dedent(
-                """\
-                clojure_source(name="core", source="core.clj", resolve="java17")
-
-                clojure_deploy_jar(
-                    name="app",
-                    main="my.app.core",
-                    dependencies=[":core"],
-                    resolve="java17",
-                )
-                """
-            ),
+            "src/BUILD": _DEPLOY_JAR_BUILD_RESOLVE,
             "src/core.clj": "(ns my.app.core (:gen-class))",
         }
     )
@@ -478,18 +490,7 @@ def test_clojure_deploy_jar_with_jdk(rule_runner: RuleRunner) -> None:
     """Test creating a clojure_deploy_jar with a specific JDK."""
     rule_runner.write_files(
         {
-            "src/BUILD": dedent(
-                """\
-                clojure_source(name="core", source="core.clj")
-
-                clojure_deploy_jar(
-                    name="app",
-                    main="my.app.core",
-                    dependencies=[":core"],
-                    jdk="17",
-                )
-                """
-            ),
+            "src/BUILD": _DEPLOY_JAR_BUILD_JDK,
             "src/core.clj": "(ns my.app.core (:gen-class))",
         }
     )
@@ -128,6 +128,20 @@ def test_generate_build_script_custom_values() -> None:
     assert 'java-cmd "/custom/java"' in script
 
 
+def test_generate_build_script_provided_jar_prefixes() -> None:
+    """Test that provided JAR prefixes are compiled into a single pattern."""
+    script = generate_build_script(
+        main_ns="my.app.core",
+        main_class="my.app.core",
+        java_cmd="/path/to/java",
+        provided_jar_prefixes=("org.clojure_clojure_", "javax.servlet_"),
+    )
+
+    assert '(def provided-jar-prefixes ["org.clojure_clojure_" "javax.servlet_"])' in script
+    assert "(def provided-jar-pattern" in script
+    assert "(comp (remove provided-jar?)" in script
+
+
 def test_build_simple_uberjar(rule_runner: RuleRunner) -> None:
     """Test building a simple uberjar with tools.build."""
     setup_rule_runner(rule_runner)